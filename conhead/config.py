@@ -2,13 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import dataclasses
+import errno
 import functools
 import pathlib
 import re
+import stat
 from typing import Any
 from typing import Optional
-
-import tomli
+from typing import Union
 
 from conhead import template as template_module
 from conhead import util
@@ -22,9 +23,16 @@ class ConfigError(Exception):
     """Raised when there is a configuration error."""
 
 
-INDENT_RE = re.compile(r"^(\s*)")
+INDENT_RE = re.compile(r"^[^\S\n]*(?=\S)", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=16)
+def _deindent_re(indent: int) -> re.Pattern:
+    """Regular expression stripping up to `indent` leading whitespace per line."""
+    return re.compile(rf"^[^\S\n]{{0,{indent}}}", re.MULTILINE)
 
 
+@functools.lru_cache(maxsize=256)
 def deindent_string(s: str):
     """
     De-indent a multi-line string.
@@ -45,24 +53,16 @@ def deindent_string(s: str):
         .....for i in range(10):
         .........print('I am de-indented')
 
+    Results are memoized on the input string.
+
     :param s: A multi-line string.
     :return: A multi-line string with all whitespace stripped based on the
         line with the shortest whitespace prefix.
     """
-    string_list = s.split("\n")
-    shortest_lead = 1e9
-    for line in string_list:
-        if line.strip():
-            match = INDENT_RE.match(line)
-            assert match
-            indent = match.group(1)
-            indent_len = len(indent)
-            shortest_lead = min(shortest_lead, indent_len)
-    if shortest_lead == 1e9:
-        shortest_lead = 0
-    for index, line in enumerate(string_list):
-        string_list[index] = line[shortest_lead:]
-    return "\n".join(string_list)
+    shortest_lead = min((len(i) for i in INDENT_RE.findall(s)), default=0)
+    if not shortest_lead:
+        return s
+    return _deindent_re(shortest_lead).sub("", s)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -80,6 +80,27 @@ class HeaderDef:
     template: str
     extensions: tuple[str, ...]
 
+    def __hash__(self) -> int:
+        # Not cached on the instance: string hashes differ between processes,
+        # so a cached value would go stale through pickling.
+        return hash((self.name, self.template, self.extensions))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare header definitions field by field.
+
+        Identical instances are equal without comparing templates.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, HeaderDef):
+            return NotImplemented
+        return (self.name, self.template, self.extensions) == (
+            other.name,
+            other.template,
+            other.extensions,
+        )
+
     @functools.cached_property
     def extensions_re(self) -> re.Pattern:
         """
@@ -119,6 +140,8 @@ class HeaderDef:
         :param dct: Dictionary of options mapping to fields of this class.
         :return: An populated instance of `HeaderDef`
         """
+        dct = dict(dct)
+
         # Template
         template = dct.pop("template", None)
         if template is None:
@@ -172,17 +195,36 @@ class Config:
         else:
             return None
 
-    def header_for_path(self, path: pathlib.Path) -> Optional[HeaderDef]:
-        """Look up `HeaderDef` for path."""
-        if not self.extensions_re:
-            return None
+    @functools.cached_property
+    def _extension_map(self) -> dict[str, HeaderDef]:
+        """
+        Mapping of every configured extension to its header definition.
 
-        match = self.extensions_re.search(str(path))
-        if match:
-            group = match.lastgroup
-            return self.header_defs[group]
-        else:
-            return None
+        When more than one header definition claims an extension, the first
+        one wins, as it does for `extensions_re`.
+        """
+        extension_map: dict[str, HeaderDef] = {}
+        for header in self.header_defs.values():
+            for extension in header.extensions:
+                extension_map.setdefault(extension, header)
+        return extension_map
+
+    def header_for_path(self, path: Union[pathlib.Path, str]) -> Optional[HeaderDef]:
+        """
+        Look up `HeaderDef` for path.
+
+        Equivalent to searching with `extensions_re`, but done with dictionary
+        lookups of each suffix following a `.`, from left to right.
+        """
+        path_str = str(path)
+        extension_map = self._extension_map
+        index = path_str.find(".")
+        while index != -1:
+            header = extension_map.get(path_str[index + 1 :])
+            if header is not None:
+                return header
+            index = path_str.find(".", index + 1)
+        return None
 
     @classmethod
     def from_dict(cls, dct: dict[str, Any]) -> "Config":
@@ -196,6 +238,7 @@ class Config:
         :param dct: Dictionary of header definitions.
         :return:
         """
+        dct = dict(dct)
         headers = {}
         headers_dct = dct.pop("header", {})
         if not isinstance(headers_dct, dict):
@@ -217,40 +260,61 @@ class Config:
         return Config(header_defs=util.FrozenDict(headers))
 
 
-def find_pyproject() -> Optional[pathlib.Path]:
+_NOT_FOUND_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.ELOOP)
+
+
+def find_pyproject(start: Optional[pathlib.Path] = None) -> Optional[pathlib.Path]:
     """
     Find `pyproject.toml` in parent directory of CWD.
+    :param start: Directory to start searching from instead of CWD.
     :return: Absolute path to `pyproject.toml` if found, else None.
     """
-    current_path = pathlib.Path.cwd()
-    while True:
-        pyproject = current_path / "pyproject.toml"
-        if pyproject.is_file():
-            return pyproject
-        parent = current_path.parent
-        if parent == current_path:
-            break
-        else:
-            current_path = parent
+    start = pathlib.Path.cwd() if start is None else start.absolute()
+    for directory in (start, *start.parents):
+        pyproject = directory / "pyproject.toml"
+        try:
+            if stat.S_ISREG(pyproject.stat().st_mode):
+                return pyproject
+        except OSError as err:
+            # Same errors that `Path.is_file` treats as "not a file".
+            if err.errno not in _NOT_FOUND_ERRNOS:
+                raise
     return None
 
 
+def parse_string(content: str) -> dict[str, Any]:
+    """
+    Parse `pyproject.toml` content.
+
+    :return: Returns dictionaries as parsed by `tomli` library.
+    """
+    # Imported here so that runs which never parse configuration do not pay
+    # for loading the TOML parser.
+    import tomli
+
+    return tomli.loads(content)
+
+
 def parse(path: pathlib.Path) -> dict[str, Any]:
     """
     Parse `pyproject.toml`.
 
     :return: Returns dictionaries as parsed by `tomli` library.
     """
-    with path.open("rb") as project_file:
-        return tomli.load(project_file)
+    return parse_string(path.read_bytes().decode())
 
 
-def load(path: pathlib.Path) -> Config:
+@functools.lru_cache(maxsize=128)
+def load_string(content: str) -> Config:
     """
-    Load `conhead` configuration.
-    :return: Populated `Config` if found, else None.
+    Load `conhead` configuration from `pyproject.toml` content.
+
+    Loading is memoized on the content. This is safe because `Config`
+    is immutable.
+
+    :return: Populated `Config`.
     """
-    config_file = parse(path)
+    config_file = parse_string(content)
     tools = config_file.get("tool", {})
     if not isinstance(tools, dict):
         raise ConfigError("tool must be section")
@@ -260,6 +324,14 @@ def load(path: pathlib.Path) -> Config:
     return Config.from_dict(conhead)
 
 
+def load(path: pathlib.Path) -> Config:
+    """
+    Load `conhead` configuration.
+    :return: Populated `Config` if found, else None.
+    """
+    return load_string(path.read_bytes().decode())
+
+
 def load_from_pyproject() -> Optional[Config]:
     """
     Load `conhead` configuration from default pyproject.toml.
@@ -14,6 +14,8 @@ T = TypeVar("T", bound="Field")
 
 @dataclasses.dataclass(frozen=True, order=True)
 class Field(Generic[T], abc.ABC):
+    __slots__ = ()
+
     name: ClassVar[str]
     regex: ClassVar[str]
 
@@ -30,12 +32,20 @@ class Field(Generic[T], abc.ABC):
     def update(self, now: datetime.datetime) -> T:
         ...  # pragma: no cover
 
+    def __reduce__(self):
+        # Frozen instances with __slots__ cannot have their state restored by
+        # assignment, so copy and pickle rebuild them through the constructor.
+        return type(self), tuple(
+            getattr(self, f.name) for f in dataclasses.fields(self)
+        )
+
 
-_GROUP_YEAR_RE = re.compile(r"^(\d{4})(?:-(\d{4}))?$")
+_GROUP_YEAR_RE = re.compile(r"(\d{4})(?:-(\d{4}))?", re.ASCII)
 
 
 @dataclasses.dataclass(frozen=True, order=True)
 class Years(Field["Years"]):
+    __slots__ = ("start", "end")
 
     start: int
     end: int
@@ -55,22 +65,19 @@ class Years(Field["Years"]):
 
     @classmethod
     def parse(cls, group_value: str) -> "Years":
-        match = _GROUP_YEAR_RE.match(group_value)
+        match = _GROUP_YEAR_RE.fullmatch(group_value)
         if not match:
             raise ValueError(f"cannot parse years: {group_value!r}")
-        start = int(match.group(1))
-        unparsed_end = match.group(2)
-        if unparsed_end:
-            end = int(unparsed_end)
-        else:
-            end = start
-        return cls(start, end)
+        start, end = match.groups()
+        return cls(int(start), int(end or start))
 
     @classmethod
     def new(cls, now: datetime.datetime) -> "Years":
         return cls(now.year, now.year)
 
     def update(self, now: datetime.datetime) -> "Years":
+        if self.end == now.year:
+            return self
         return type(self)(self.start, now.year)
 
 
@@ -79,6 +86,7 @@ _DATE_FORMAT = "%Y-%m-%d"
 
 @dataclasses.dataclass(frozen=True, order=True)
 class Date(Field["Date"]):
+    __slots__ = ("date",)
 
     date: datetime.date
 
@@ -98,4 +106,6 @@ class Date(Field["Date"]):
         return cls(now.date())
 
     def update(self, now: datetime.datetime) -> "Date":
+        if self.date == now.date():
+            return self
         return self.new(now)
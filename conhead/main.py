@@ -5,6 +5,7 @@ import contextlib
 import dataclasses
 import datetime
 import logging
+import os
 import pathlib
 import sys
 from typing import Iterator
@@ -59,13 +60,18 @@ def _check_and_delete_mutually_exclusive(
 
 
 def iter_dir(dir: pathlib.Path) -> Iterator[pathlib.Path]:
-    for entry in sorted(dir.iterdir()):
+    # Directory entries from scandir carry their type, so classifying them
+    # does not need further stat calls on most file systems. Names are sorted
+    # as paths so that ordering follows the platform, as it did with iterdir.
+    with os.scandir(dir) as scanner:
+        entries = sorted(scanner, key=lambda e: pathlib.PurePath(e.name))
+    for entry in entries:
         if entry.is_symlink():
             continue
-        if entry.is_dir():
-            yield from iter_dir(entry)
-        elif entry.is_file():
-            yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_dir(dir / entry.name)
+        elif entry.is_file(follow_symlinks=False):
+            yield dir / entry.name
 
 
 def iter_path(path: pathlib.Path) -> Iterator[tuple[pathlib.Path, bool]]:
@@ -146,7 +152,7 @@ def main(paths, check, delete, config_path, verbose, show_changes, quiet):
             else:
                 cfg = config.load(pathlib.Path(config_path))
         except OSError as err:
-            logger.error(f"Unable read configuration: {err}")
+            logger.error("Unable read configuration: %s", err)
             sys.exit(1)
         if not cfg.header_defs:
             logger.error("no header configuration defined")
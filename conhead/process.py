@@ -36,12 +36,27 @@ class CheckResult:
         header.
     """
 
+    __slots__ = (
+        "is_up_to_date",
+        "content",
+        "header_def",
+        "updated_values",
+        "parsed_values",
+    )
+
     is_up_to_date: bool
     content: Optional[str]
     header_def: Optional[config.HeaderDef]
     updated_values: Optional[template.FieldValues]
     parsed_values: Optional[template.ParsedValues]
 
+    def __reduce__(self):
+        # Slotted frozen instances are copied through the constructor, which
+        # takes the fields in declaration order.
+        return type(self), tuple(
+            getattr(self, f.name) for f in dataclasses.fields(self)
+        )
+
     @property
     def has_content(self):
         return bool(self.content)
@@ -72,9 +87,6 @@ def check_path(
     :param path: Relative or absolute path.
     :return: `CheckResult` instance.
     """
-    if isinstance(path, str):
-        path = pathlib.Path(path)
-
     up_to_date = False
     content = None
     updated_values = None
@@ -95,7 +107,8 @@ def check_path(
         )
 
     try:
-        content = path.read_text()
+        with open(path) as source_file:
+            content = source_file.read()
     except FileNotFoundError:
         logger.error("file not found: %s", path)
         return CheckResult(
@@ -157,9 +170,6 @@ def rewrite_file(
     :param show_changes: If True, show changes to file, else don't show changes.
     :return: True if header rewritten, else False.
     """
-    if isinstance(path, str):
-        path = pathlib.Path(path)
-
     if remove_header:
         logger.info("removing header: %s", path)
     else:
@@ -177,20 +187,23 @@ def rewrite_file(
         new_header = template.write_header(header_def.template, field_values)
 
     if show_changes:
-        click.secho(path)
-        if parsed_values:
-            click.secho(parsed_values.header, fg="red")
-        else:
-            click.secho("New header", fg="red")
-        click.secho("")
-        if not new_header:
-            click.secho("Header removed", fg="green")
-        else:
-            click.secho(new_header, fg="green")
-        click.secho("")
+        old_header = parsed_values.header if parsed_values else "New header"
+        # Written as a single block so that changes for one file are not
+        # interleaved with other output.
+        click.echo(
+            "\n".join(
+                [
+                    str(path),
+                    click.style(old_header, fg="red"),
+                    "",
+                    click.style(new_header or "Header removed", fg="green"),
+                    "",
+                ]
+            )
+        )
 
     try:
-        with path.open("w") as source_file:
+        with open(path, "w") as source_file:
             if new_header:
                 source_file.write(new_header)
             source_file.write(headerless_content)
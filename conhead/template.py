@@ -3,6 +3,7 @@
 #
 import dataclasses
 import enum
+import functools
 import io
 import re
 from typing import Generic
@@ -43,13 +44,15 @@ class TokenKind(enum.Enum):
     ESCAPED = r"\\[{}\\]"
     FIELD = r"{{[^}]+}}"
     INVALID = r"[{}\\]"
-    CONTENT = r"."
+    CONTENT = r"[^\n{}\\]+"
 
 
 T = TypeVar("T")
 
 
 class Token(Generic[T]):
+    __slots__ = ("__kind", "__unparsed", "__row", "__column", "__parsed")
+
     @property
     def kind(self) -> TokenKind:
         return self.__kind
@@ -88,12 +91,12 @@ class Token(Generic[T]):
 
     def __eq__(self, other):
         if isinstance(other, Token):
-            return (self.kind, self.unparsed, self.row, self.column, self.parsed) == (
-                other.kind,
-                other.unparsed,
-                other.row,
-                other.column,
-                other.parsed,
+            return (
+                self.__kind is other.__kind
+                and self.__row == other.__row
+                and self.__column == other.__column
+                and self.__unparsed == other.__unparsed
+                and self.__parsed == other.__parsed
             )
         else:
             return NotImplemented
@@ -103,6 +106,8 @@ _TOKENIZER_RE = re.compile("|".join(f"(?P<{t.name}>{t.value})" for t in TokenKin
 
 _FIELD_RE = re.compile(r"{{(.*)}}")
 
+_FIELD_KINDS_BY_NAME = {kind.name: kind for kind in FieldKind}
+
 
 FieldValues = tuple[fields.Field, ...]
 
@@ -116,9 +121,17 @@ class ParsedValues:
     :header: The parsed header itself with all field values embedded.
     """
 
+    __slots__ = ("fields", "header")
+
     fields: FieldValues
     header: str
 
+    def __reduce__(self):
+        # Slotted frozen instances are copied through the constructor.
+        return type(self), tuple(
+            getattr(self, f.name) for f in dataclasses.fields(self)
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class HeaderParser:
@@ -177,23 +190,20 @@ def tokenize_template(template: str) -> Iterator[Token]:
     :return:
     """
     line = 1
-    column = 1
-    content = io.StringIO()
+    # Columns are derived from match offsets relative to the start of the
+    # current line rather than accumulated token by token.
+    line_start = 0
     for match in _TOKENIZER_RE.finditer(template):
         assert match.lastgroup
         kind = TokenKind[match.lastgroup]
-        value = match.group(kind.name)
+        value = match.group()
+        column = match.start() - line_start + 1
 
-        if kind == TokenKind.CONTENT:
-            content.write(value)
+        # Content is matched as maximal runs, so each match is a whole token.
+        if kind is TokenKind.CONTENT:
+            yield Token(kind, value, line, column, value)
             continue
 
-        content_value = content.getvalue()
-        if content_value:
-            yield Token(TokenKind.CONTENT, content_value, line, column, content_value)
-            column += len(content_value)
-            content = io.StringIO()
-
         if kind == TokenKind.INVALID:
             raise TemplateError(f"Invalid character {value!r} found at {line}:{column}")
 
@@ -203,14 +213,12 @@ def tokenize_template(template: str) -> Iterator[Token]:
             field_match = _FIELD_RE.match(value)
             assert field_match
             field_kind_name = field_match.group(1)
-            try:
-                field_kind = FieldKind[field_kind_name]
-            except KeyError:
+            field_kind = _FIELD_KINDS_BY_NAME.get(field_kind_name)
+            if field_kind is None:
                 raise TemplateError(
                     f"Unknown field type {field_kind_name!r} at {line}:{column}"
                 )
-            else:
-                parsed_value = cast(type[fields.Field], field_kind)
+            parsed_value = cast(type[fields.Field], field_kind)
         else:
             parsed_value = value
 
@@ -218,16 +226,10 @@ def tokenize_template(template: str) -> Iterator[Token]:
 
         if kind is TokenKind.NEWLINE:
             line += 1
-            column = 1
-        else:
-            column += len(value)
-
-    content_value = content.getvalue()
-    if content_value:
-        yield Token(TokenKind.CONTENT, content_value, line, column, content_value)
-        column += len(content_value)
+            line_start = match.end()
 
 
+@functools.lru_cache(maxsize=None)
 def make_template_parser(template: str) -> HeaderParser:
     """
     Build a template parser from a header template.
@@ -237,6 +239,9 @@ def make_template_parser(template: str) -> HeaderParser:
     The other is the sequence of field types found in the sequence
     of groups.
 
+    Parsers are immutable and memoized, so header definitions sharing
+    a template share a single compiled parser.
+
     :param template: A header template as read from configuration.
     :return:
     """
@@ -252,7 +257,33 @@ def make_template_parser(template: str) -> HeaderParser:
             groups.append(field_kind)
         else:
             pattern.write(re.escape(token.parsed))
-    return HeaderParser(tuple(groups), re.compile(pattern.getvalue()))
+    return HeaderParser(tuple(groups), re.compile(pattern.getvalue(), re.ASCII))
+
+
+@functools.lru_cache(maxsize=None)
+def _header_parts(template: str) -> tuple[Optional[str], ...]:
+    """
+    Split a header template into the parts needed to write it.
+
+    Adjacent literal text is merged into single strings and every field is
+    represented by None, so writing a header does not re-tokenize the template.
+
+    :param template: Header template as found in `HeaderDef`.
+    :return: Literal strings with None in place of each field.
+    """
+    parts: list[Optional[str]] = []
+    literal: list[str] = []
+    for token in tokenize_template(template):
+        if token.kind is TokenKind.FIELD:
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            parts.append(None)
+        else:
+            literal.append(token.parsed)
+    if literal:
+        parts.append("".join(literal))
+    return tuple(parts)
 
 
 def write_header(template: str, values: FieldValues) -> str:
@@ -269,11 +300,9 @@ def write_header(template: str, values: FieldValues) -> str:
     """
     header = []
     value_iterator = iter(values)
-    for token in tokenize_template(template):
-        kind = token.kind
-        if kind is TokenKind.FIELD:
-            field_value = next(value_iterator)
-            header.append(str(field_value))
+    for part in _header_parts(template):
+        if part is None:
+            header.append(str(next(value_iterator)))
         else:
-            header.append(token.parsed)
+            header.append(part)
     return "".join(header)
@@ -15,13 +15,33 @@ class FrozenDict(collections.abc.Hashable, collections.abc.Mapping[str, A]):
     A read-only dictionary capable of being hashed.
     """
 
+    __slots__ = ("__dict", "__hash")
+
     __dict: dict[str, A]
+    __hash: Optional[int]
+
+    def __new__(cls, dct: Optional[Mapping[str, A]] = None, /, **kwargs):
+        # Empty instances are indistinguishable, so all of them are the same
+        # shared object.
+        if cls is FrozenDict and _empty is not None and not dct and not kwargs:
+            return _empty
+        return super().__new__(cls)
 
     def __init__(self, dct: Optional[Mapping[str, A]] = None, /, **kwargs):
-        self.__dict = {}
-        self.__dict.update(kwargs)
+        if self is _empty:
+            return
+        if isinstance(dct, FrozenDict):
+            # Wrapped dicts are never mutated, so one can be shared.
+            dct = dct.__dict
+            if not kwargs:
+                self.__dict = dct
+                self.__hash = None
+                return
+        # The kwargs dict is created fresh for each call, so it is owned here.
+        self.__dict = kwargs
         if dct is not None:
             self.__dict.update(dct)
+        self.__hash = None
 
     def __len__(self):
         return len(self.__dict)
@@ -38,24 +58,62 @@ class FrozenDict(collections.abc.Hashable, collections.abc.Mapping[str, A]):
     def __repr__(self):
         return repr(self.__dict)
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, FrozenDict):
+            if (
+                self.__hash is not None
+                and other.__hash is not None
+                and self.__hash != other.__hash
+            ):
+                return False
+            return self.__dict == other.__dict
+        elif isinstance(other, collections.abc.Mapping):  # type: ignore
+            return self.__dict == dict(other.items())
+        else:
+            return NotImplemented
+
     def __or__(self, other):
         if isinstance(other, collections.abc.Mapping):  # type: ignore
-            return type(self)(self.__dict | other)
+            if not other:
+                return self
+            merged = dict(self.__dict)
+            merged.update(other)
+            return type(self)(merged)
         else:
             return NotImplemented
 
     def __ror__(self, other):
         if isinstance(other, collections.abc.Mapping):  # type: ignore
-            return type(self)(other | self.__dict)
+            if not other:
+                return self
+            merged = dict(other.items())
+            merged.update(self.__dict)
+            return type(self)(merged)
         else:
             return NotImplemented
 
+    def __reduce__(self):
+        return type(self), (self.__dict,)
+
     def __copy__(self):
-        cp = type(self)(self)
+        if self is _empty:
+            return self
+        # The wrapped dict is never mutated, so copies share it and the hash.
+        cp = object.__new__(type(self))
+        cp.__dict = self.__dict
+        cp.__hash = self.__hash
         return cp
 
     def copy(self):
         return copy.copy(self)
 
     def __hash__(self):
-        return hash(tuple(self.items()))
+        if self.__hash is None:
+            self.__hash = hash(frozenset(self.__dict.items()))
+        return self.__hash
+
+
+_empty: Optional[FrozenDict] = None
+_empty = FrozenDict()
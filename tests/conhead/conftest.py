@@ -1,11 +1,7 @@
 # Copyright 2022 Rafe Kaplan
 # SPDX-License-Identifier: Apache-2.0
 #
-import datetime
-import os
 import pathlib
-from typing import Iterable
-from typing import Iterator
 from typing import Optional
 
 import pytest
@@ -39,32 +35,23 @@ def project_dir_content(pyproject_toml, source_dir) -> file_testing.DirContent:
 
 
 @pytest.fixture(autouse=True)
-def project_dir(tmp_path, project_dir_content) -> Iterator[pathlib.Path]:
+def project_dir(tmp_path, monkeypatch, project_dir_content) -> pathlib.Path:
     project_dir = tmp_path / "project"
     file_testing.write_content(project_dir, project_dir_content)
-    cwd = pathlib.Path.cwd()
-    try:
-        os.chdir(project_dir)
-        yield project_dir
-    finally:
-        os.chdir(cwd)
+    monkeypatch.chdir(project_dir)
+    return project_dir
 
 
 @pytest.fixture
 def conhead_config(pyproject_toml) -> config.Config:
-    return config.load_from_pyproject() or config.Config(header_defs=util.FrozenDict())
+    if pyproject_toml is None:
+        return config.Config(header_defs=util.FrozenDict())
+    return config.load_string(config.deindent_string(pyproject_toml))
 
 
 @pytest.fixture
-def fake_time() -> Iterable[None]:
-    original_now = main.naive_now
-    try:
-
-        def fake_now() -> Iterator[datetime.datetime]:
-            yield NOW
-
-        iterator = fake_now()
-        main.naive_now = lambda: next(iterator)
-        yield
-    finally:
-        main.naive_now = original_now
+def fake_time(monkeypatch):
+    # Only a single value is provided, so reading the time more than once
+    # per run fails the test.
+    times = iter([NOW])
+    monkeypatch.setattr(main, "naive_now", lambda: next(times))
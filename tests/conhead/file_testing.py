@@ -60,37 +60,60 @@ class Fifo:
     """
 
 
+class _Chmod:
+    """
+    Deferred permission change applied once an entry has been written.
+    """
+
+    mode: int
+
+    def __init__(self, mode: int):
+        self.mode = mode
+
+
 def write_content(path: pathlib.Path, entry: DirEntry):
     """
     Write directory entry to path.
 
+    Entries are written depth first from an explicit stack rather than by
+    recursion, in the same order as they appear in their directories.
+
     :param path: Target path for directory entry.
     :param content: Any `DirEntry` type.
     """
-    if isinstance(entry, dict):
-        path.mkdir()
-        for file_name, entry in entry.items():
-            write_content(path / file_name, entry)
-    elif isinstance(entry, str):
-        content = config.deindent_string(entry)
-        with open(path, "w") as open_file:
-            open_file.write(content)
-    elif isinstance(entry, Perm):
-        write_content(path, entry.content)
-        mode = 0
-        if entry.read:
-            mode |= stat.S_IREAD
-        if entry.write:
-            mode |= stat.S_IWRITE
-        os.chmod(path, mode)
-    elif isinstance(entry, Symlink):
-        target = path.parent / entry.ref
-        is_dir = target.is_dir()
-        path.symlink_to(entry.ref, target_is_directory=is_dir)
-    elif isinstance(entry, Fifo):
-        assert not sys.platform.startswith("win")
-        os.mkfifo(path)
-    elif entry is None:
-        pass
-    else:
-        raise TypeError(f"Unexpected type: {type(entry)}")
+    # Paths are handled as plain strings internally to avoid building a
+    # `pathlib.Path` for every entry.
+    stack: list[tuple[str, Union[DirEntry, _Chmod]]] = [(os.fspath(path), entry)]
+    while stack:
+        node_path, node = stack.pop()
+        if isinstance(node, dict):
+            os.mkdir(node_path)
+            stack.extend(
+                (os.path.join(node_path, file_name), child)
+                for file_name, child in reversed(node.items())
+            )
+        elif isinstance(node, str):
+            content = config.deindent_string(node)
+            with open(node_path, "w") as open_file:
+                open_file.write(content)
+        elif isinstance(node, Perm):
+            mode = 0
+            if node.read:
+                mode |= stat.S_IREAD
+            if node.write:
+                mode |= stat.S_IWRITE
+            stack.append((node_path, _Chmod(mode)))
+            stack.append((node_path, node.content))
+        elif isinstance(node, _Chmod):
+            os.chmod(node_path, node.mode)
+        elif isinstance(node, Symlink):
+            target = os.path.join(os.path.dirname(node_path), node.ref)
+            is_dir = os.path.isdir(target)
+            os.symlink(node.ref, node_path, target_is_directory=is_dir)
+        elif isinstance(node, Fifo):
+            assert not sys.platform.startswith("win")
+            os.mkfifo(node_path)
+        elif node is None:
+            pass
+        else:
+            raise TypeError(f"Unexpected type: {type(node)}")
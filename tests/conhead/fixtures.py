@@ -6,7 +6,7 @@ import pytest
 from tests.conhead import file_testing
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def populated_pyproject_toml() -> str:
     return '''
             [tool.conhead.header.header1]
@@ -1,7 +1,8 @@
 # Copyright 2022 Rafe Kaplan
 # SPDX-License-Identifier: Apache-2.0
 #
-import os
+import pathlib
+import pickle
 
 import pytest
 
@@ -30,6 +31,20 @@ class TestDeindentString:
             "\n{\n    {\n        {\n        }\n    }\n}\n"
         )
 
+    @staticmethod
+    def test_whitespace_only_lines():
+        string = "    line 1\n      \n  \n    line 2"
+        assert config.deindent_string(string) == "line 1\n  \n\nline 2"
+
+    @staticmethod
+    def test_mixed_whitespace():
+        assert config.deindent_string("\tline 1\n    line 2") == "line 1\n   line 2"
+
+    @staticmethod
+    def test_memoized():
+        string = "    line 1\n    line 2"
+        assert config.deindent_string(string) is config.deindent_string(string)
+
 
 class TestHeaderDef:
     @staticmethod
@@ -53,6 +68,27 @@ class TestHeaderDef:
 
         assert cfg.parser.fields == (template.FieldKind.YEARS,)
 
+    @staticmethod
+    def test_eq():
+        cfg = config.HeaderDef(name="test", template="t", extensions=("ext1",))
+        assert cfg == cfg
+        assert cfg == config.HeaderDef(name="test", template="t", extensions=("ext1",))
+        assert hash(cfg) == hash(
+            config.HeaderDef(name="test", template="t", extensions=("ext1",))
+        )
+        assert cfg != config.HeaderDef(name="test", template="u", extensions=("ext1",))
+        assert cfg != config.HeaderDef(name="test", template="t", extensions=("ext2",))
+        assert cfg != "test"
+
+    @staticmethod
+    def test_pickle():
+        cfg = config.HeaderDef(name="test", template="t", extensions=("ext1",))
+        hash(cfg)
+        unpickled = pickle.loads(pickle.dumps(cfg))
+        assert unpickled == cfg
+        assert hash(unpickled) == hash(cfg)
+        assert unpickled in {cfg}
+
     class TestFromDict:
         @staticmethod
         @pytest.mark.parametrize(
@@ -274,6 +310,28 @@ class TestConfig:
                 assert header
                 assert header is conhead_config.header_defs["header2"]
 
+            @staticmethod
+            @pytest.mark.parametrize(
+                "pyproject_toml",
+                [
+                    """
+                    [tool.conhead.header.header1]
+                    template = ""
+                    extensions = ["gz"]
+
+                    [tool.conhead.header.header2]
+                    template = ""
+                    extensions = ["tar.gz", "gz"]
+                    """
+                ],
+            )
+            def test_multi_part_extension(conhead_config):
+                header1 = conhead_config.header_defs["header1"]
+                header2 = conhead_config.header_defs["header2"]
+                assert conhead_config.header_for_path("path1/file.tar.gz") is header2
+                assert conhead_config.header_for_path("path1/file.gz") is header1
+                assert conhead_config.header_for_path("path.tar/file.gz") is header1
+
     class TestFromDict:
         @staticmethod
         @pytest.mark.parametrize(
@@ -355,7 +413,7 @@ class TestConfig:
 class TestFindPyproject:
     class TestFound:
         @staticmethod
-        @pytest.fixture
+        @pytest.fixture(scope="class")
         def project_dir_content() -> file_testing.DirContent:
             return {"pyproject.toml": "", "subdir1": {"subdir2": {}}}
 
@@ -366,8 +424,12 @@ class TestFindPyproject:
 
         @staticmethod
         def test_find_from_sub_dirs(project_dir):
-            os.chdir(project_dir / "subdir1" / "subdir2")
-            found = config.find_pyproject()
+            found = config.find_pyproject(project_dir / "subdir1" / "subdir2")
+            assert found == project_dir / "pyproject.toml"
+
+        @staticmethod
+        def test_find_from_relative_start(project_dir):
+            found = config.find_pyproject(pathlib.Path("subdir1", "subdir2"))
             assert found == project_dir / "pyproject.toml"
 
     @staticmethod
@@ -379,6 +441,14 @@ class TestFindPyproject:
     def test_not_file(project_dir):
         assert config.find_pyproject() is None
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "project_dir_content",
+        [{"pyproject.toml": file_testing.Symlink("pyproject.toml")}],
+    )
+    def test_symlink_loop(project_dir):
+        assert config.find_pyproject() is None
+
 
 class TestParse:
     @staticmethod
@@ -438,6 +508,8 @@ class TestLoad:
             extensions=("toml",),
         )
 
+        assert config.load(pyproject_path) is conhead_config
+
     @staticmethod
     @pytest.mark.parametrize(
         "pyproject_toml",
@@ -1,7 +1,9 @@
 # Copyright 2022 Rafe Kaplan
 # SPDX-License-Identifier: Apache-2.0
 #
+import copy
 import datetime
+import pickle
 
 import pytest
 
@@ -25,6 +27,16 @@ class TestYears:
     def test_iterate_years():
         assert tuple(fields.Years(2014, 2019)) == (2014, 2019)
 
+    @staticmethod
+    def test_slots():
+        assert not hasattr(fields.Years(2014, 2019), "__dict__")
+
+    @staticmethod
+    def test_copy():
+        years = fields.Years(2014, 2019)
+        assert copy.copy(years) == years
+        assert pickle.loads(pickle.dumps(years)) == years
+
     class TestParse:
         @staticmethod
         def test_single_year():
@@ -36,12 +48,26 @@ class TestYears:
 
         @staticmethod
         @pytest.mark.parametrize(
-            "invalid", ["100", "10000", "", "abcd", "2014-100", "2014-10000"]
+            "invalid",
+            [
+                "100",
+                "10000",
+                "",
+                "abcd",
+                "2014-100",
+                "2014-10000",
+                "\u0662\u0660\u0661\u0664",
+            ],
         )
         def test_invalid(invalid):
             with pytest.raises(ValueError, match=rf"^cannot parse years: {invalid!r}$"):
                 fields.Years.parse(invalid)
 
+        @staticmethod
+        def test_trailing_newline():
+            with pytest.raises(ValueError, match=r"^cannot parse years: '2014\\n'$"):
+                fields.Years.parse("2014\n")
+
     @staticmethod
     def test_new():
         assert fields.Years.new(NOW_DATETIME) == fields.Years(2019, 2019)
@@ -51,12 +77,23 @@ class TestYears:
         original = fields.Years(2014, 2015)
         assert original.update(NOW_DATETIME) == fields.Years(2014, 2019)
 
+    @staticmethod
+    def test_update_unchanged():
+        original = fields.Years(2014, 2019)
+        assert original.update(NOW_DATETIME) is original
+
 
 class TestDate:
     @staticmethod
     def test_str():
         assert str(fields.Date(NOW_DATE)) == "2019-12-10"
 
+    @staticmethod
+    def test_copy():
+        date = fields.Date(NOW_DATE)
+        assert copy.deepcopy(date) == date
+        assert pickle.loads(pickle.dumps(date)) == date
+
     @staticmethod
     def test_new():
         assert fields.Date.new(NOW_DATETIME) == fields.Date(NOW_DATE)
@@ -65,3 +102,8 @@ class TestDate:
     def test_update():
         original = fields.Date(datetime.date(2012, 6, 12))
         assert original.update(NOW_DATETIME) == fields.Date(NOW_DATE)
+
+    @staticmethod
+    def test_update_unchanged():
+        original = fields.Date(NOW_DATE)
+        assert original.update(NOW_DATETIME) is original
@@ -4,8 +4,9 @@
 import datetime
 import inspect
 import logging
+import os
 import pathlib
-import sys
+import types
 
 import click
 import pytest
@@ -13,6 +14,7 @@ import pytest
 from conhead import main
 from tests.conhead import file_testing
 from tests.conhead import fixtures
+from tests.conhead.test_process import NOW
 
 
 @pytest.mark.parametrize(
@@ -41,12 +43,17 @@ def test_conhead_logger(verbose, quiet, expected):
     assert "conhead" not in manager.loggerDict
 
 
-def test_naive_now():
-    dt = main.naive_now()
-    expected = datetime.datetime.now()
-    delta = datetime.timedelta(seconds=10)
-    assert dt < expected + delta
-    assert dt > expected - delta
+def test_naive_now(monkeypatch):
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            assert tz is None
+            return NOW
+
+    monkeypatch.setattr(
+        main, "datetime", types.SimpleNamespace(datetime=FrozenDatetime)
+    )
+    assert main.naive_now() is NOW
 
 
 class TestIterFilesystem:
@@ -71,17 +78,25 @@ class TestIterFilesystem:
         iterator = main.iter_dir(project_dir)
         assert inspect.isgenerator(iterator)
 
-        sub_file1, sub_file2, sub_file3, a_file = list(iterator)
-        assert a_file.relative_to(project_dir) == pathlib.Path("a-file")
-        assert sub_file1.relative_to(project_dir) == pathlib.Path("a-dir/a-sub-file1")
-        assert sub_file2.relative_to(project_dir) == pathlib.Path("a-dir/a-sub-file2")
-        assert sub_file3.relative_to(project_dir) == pathlib.Path(
-            "a-dir/another-dir/a-sub-file3"
-        )
+        assert [p.relative_to(project_dir) for p in iterator] == [
+            pathlib.Path("a-dir/a-sub-file1"),
+            pathlib.Path("a-dir/a-sub-file2"),
+            pathlib.Path("a-dir/another-dir/a-sub-file3"),
+            pathlib.Path("a-file"),
+        ]
 
     @staticmethod
-    @pytest.mark.skipif(sys.platform.startswith("win"), reason="Do not run on Windows")
-    @pytest.mark.parametrize("project_dir_content", [{"a-pipe": file_testing.Fifo()}])
+    @pytest.mark.parametrize(
+        "project_dir_content",
+        [
+            pytest.param(
+                {"a-pipe": file_testing.Fifo()},
+                marks=pytest.mark.skipif(
+                    not hasattr(os, "mkfifo"), reason="Requires os.mkfifo"
+                ),
+            )
+        ],
+    )
     def test_iter_non_file(project_dir):
         iterator = main.iter_dir(project_dir)
         assert inspect.isgenerator(iterator)
@@ -111,17 +126,12 @@ class TestIterFilesystem:
             iterator = main.iter_path(project_dir / "a-dir")
             assert inspect.isgenerator(iterator)
 
-            (
-                (sub_file1, is_param1),
-                (sub_file2, is_param2),
-                (sub_file3, is_param3),
-            ) = iterator
-            assert sub_file1 == project_dir / "a-dir" / "a-sub-file1"
-            assert not is_param1
-            assert sub_file2 == project_dir / "a-dir" / "a-sub-file2"
-            assert not is_param2
-            assert sub_file3 == project_dir / "a-dir" / "another-dir" / "a-sub-file3"
-            assert not is_param3
+            a_dir = project_dir / "a-dir"
+            assert list(iterator) == [
+                (a_dir / "a-sub-file1", False),
+                (a_dir / "a-sub-file2", False),
+                (a_dir / "another-dir" / "a-sub-file3", False),
+            ]
 
 
 @pytest.mark.usefixtures("fake_time")
@@ -208,26 +218,20 @@ class TestMain:
         result = cli_runner.invoke(main.main, ["-vvv", "src/up-to-date.ext2"])
         assert result.exit_code == 0
 
-        process, up_to_date = caplog.record_tuples
-        assert process == ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2")
-        assert up_to_date == (
-            "conhead",
-            logging.INFO,
-            "up to date: src/up-to-date.ext2",
-        )
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2"),
+            ("conhead", logging.INFO, "up to date: src/up-to-date.ext2"),
+        ]
 
     @staticmethod
     def test_no_header_def(cli_runner, caplog):
         result = cli_runner.invoke(main.main, ["-vvv", "src/unmatched.unknown"])
         assert result.exit_code == 1
 
-        process, no_header_def = caplog.record_tuples
-        assert process == ("conhead", logging.DEBUG, "checking: src/unmatched.unknown")
-        assert no_header_def == (
-            "conhead",
-            logging.ERROR,
-            "no header def: src/unmatched.unknown",
-        )
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/unmatched.unknown"),
+            ("conhead", logging.ERROR, "no header def: src/unmatched.unknown"),
+        ]
 
     @staticmethod
     def test_has_errors_check(cli_runner, caplog):
@@ -237,19 +241,12 @@ class TestMain:
         )
         assert result.exit_code == 1
 
-        process1, ok, process2, error = caplog.record_tuples
-        assert process1 == ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2")
-        assert ok == (
-            "conhead",
-            logging.INFO,
-            "up to date: src/up-to-date.ext2",
-        )
-        assert process2 == ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4")
-        assert error == (
-            "conhead",
-            logging.WARNING,
-            "out of date: src/out-of-date.ext4",
-        )
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2"),
+            ("conhead", logging.INFO, "up to date: src/up-to-date.ext2"),
+            ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4"),
+            ("conhead", logging.WARNING, "out of date: src/out-of-date.ext4"),
+        ]
 
     @staticmethod
     def test_no_header(cli_runner, caplog):
@@ -262,14 +259,11 @@ class TestMain:
         rewritten = pathlib.Path("src/no-header.ext3").read_text()
         assert rewritten == "// line 1 2019\n// line 2 2019\n// No proper header\n"
 
-        load, error, write = caplog.record_tuples
-        assert load == ("conhead", logging.DEBUG, "checking: src/no-header.ext3")
-        assert error == (
-            "conhead",
-            logging.WARNING,
-            "missing header: src/no-header.ext3",
-        )
-        assert write == ("conhead", logging.INFO, "rewriting: src/no-header.ext3")
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/no-header.ext3"),
+            ("conhead", logging.WARNING, "missing header: src/no-header.ext3"),
+            ("conhead", logging.INFO, "rewriting: src/no-header.ext3"),
+        ]
 
     @staticmethod
     def test_out_of_date(cli_runner, caplog):
@@ -282,14 +276,11 @@ class TestMain:
         rewritten = pathlib.Path("src/out-of-date.ext4").read_text()
         assert rewritten == "// line 1 2018-2019\n// line 2 2014-2019\ncontent\n"
 
-        load, error, write = caplog.record_tuples
-        assert load == ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4")
-        assert error == (
-            "conhead",
-            logging.WARNING,
-            "out of date: src/out-of-date.ext4",
-        )
-        assert write == ("conhead", logging.INFO, "rewriting: src/out-of-date.ext4")
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4"),
+            ("conhead", logging.WARNING, "out of date: src/out-of-date.ext4"),
+            ("conhead", logging.INFO, "rewriting: src/out-of-date.ext4"),
+        ]
 
     @staticmethod
     def test_quiet(cli_runner, caplog):
@@ -311,52 +302,16 @@ class TestMain:
             ],
         )
         assert result.exit_code == 1
-        (
-            process1,
-            up_to_date1,
-            process2,
-            up_to_date2,
-            skip,
-            process3,
-            missing,
-            write,
-        ) = caplog.record_tuples
-
-        assert process1 == (
-            "conhead",
-            logging.DEBUG,
-            "checking: src/sub-dir/file1.ext1",
-        )
-        assert up_to_date1 == (
-            "conhead",
-            logging.INFO,
-            "up to date: src/sub-dir/file1.ext1",
-        )
-        assert process2 == (
-            "conhead",
-            logging.DEBUG,
-            "checking: src/sub-dir/file2.ext3",
-        )
-
-        assert skip == ("conhead", logging.DEBUG, "skipping: src/sub-dir/file3.unknown")
-
-        assert process3 == (
-            "conhead",
-            logging.DEBUG,
-            "checking: src/sub-dir/file4.ext1",
-        )
-
-        assert missing == (
-            "conhead",
-            logging.WARNING,
-            "missing header: src/sub-dir/file4.ext1",
-        )
-
-        assert write == (
-            "conhead",
-            logging.INFO,
-            "rewriting: src/sub-dir/file4.ext1",
-        )
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/sub-dir/file1.ext1"),
+            ("conhead", logging.INFO, "up to date: src/sub-dir/file1.ext1"),
+            ("conhead", logging.DEBUG, "checking: src/sub-dir/file2.ext3"),
+            ("conhead", logging.INFO, "up to date: src/sub-dir/file2.ext3"),
+            ("conhead", logging.DEBUG, "skipping: src/sub-dir/file3.unknown"),
+            ("conhead", logging.DEBUG, "checking: src/sub-dir/file4.ext1"),
+            ("conhead", logging.WARNING, "missing header: src/sub-dir/file4.ext1"),
+            ("conhead", logging.INFO, "rewriting: src/sub-dir/file4.ext1"),
+        ]
 
     @staticmethod
     def test_delete(cli_runner, caplog):
@@ -381,52 +336,16 @@ class TestMain:
         rewritten = pathlib.Path("src/out-of-date.ext4").read_text()
         assert rewritten == "content\n"
 
-        (
-            process1,
-            missing_header,
-            process2,
-            up_to_date,
-            remove1,
-            process3,
-            out_of_date,
-            remove3,
-        ) = caplog.record_tuples
-
-        assert process1 == ("conhead", logging.DEBUG, "checking: src/no-header.ext3")
-
-        assert missing_header == (
-            "conhead",
-            logging.WARNING,
-            "missing header: src/no-header.ext3",
-        )
-
-        assert process2 == ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2")
-
-        assert up_to_date == (
-            "conhead",
-            logging.INFO,
-            "up to date: src/up-to-date.ext2",
-        )
-
-        assert remove1 == (
-            "conhead",
-            logging.INFO,
-            "removing header: src/up-to-date.ext2",
-        )
-
-        assert process3 == ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4")
-
-        assert out_of_date == (
-            "conhead",
-            logging.WARNING,
-            "out of date: src/out-of-date.ext4",
-        )
-
-        assert remove3 == (
-            "conhead",
-            logging.INFO,
-            "removing header: src/out-of-date.ext4",
-        )
+        assert caplog.record_tuples == [
+            ("conhead", logging.DEBUG, "checking: src/no-header.ext3"),
+            ("conhead", logging.WARNING, "missing header: src/no-header.ext3"),
+            ("conhead", logging.DEBUG, "checking: src/up-to-date.ext2"),
+            ("conhead", logging.INFO, "up to date: src/up-to-date.ext2"),
+            ("conhead", logging.INFO, "removing header: src/up-to-date.ext2"),
+            ("conhead", logging.DEBUG, "checking: src/out-of-date.ext4"),
+            ("conhead", logging.WARNING, "out of date: src/out-of-date.ext4"),
+            ("conhead", logging.INFO, "removing header: src/out-of-date.ext4"),
+        ]
 
     @staticmethod
     def test_process_whole_dir(cli_runner, caplog, project_dir):
@@ -434,8 +353,8 @@ class TestMain:
         assert result.exit_code == 1
         update_reports = [
             message
-            for (_, _, message) in caplog.record_tuples
-            if message.startswith("checking:") or message.startswith("skipping:")
+            for message in caplog.messages
+            if message.startswith(("checking:", "skipping:"))
         ]
 
         assert update_reports == [
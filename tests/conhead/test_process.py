@@ -1,11 +1,11 @@
 # Copyright 2022 Rafe Kaplan
 # SPDX-License-Identifier: Apache-2.0
 #
+import copy
 import datetime
 import logging
 import pathlib
 import stat
-from typing import Iterator
 
 import pytest
 
@@ -22,13 +22,21 @@ source_dir = fixtures.populated_source_dir
 
 
 @pytest.fixture
-def logger() -> Iterator[logging.Logger]:
-    logger = logging.getLogger("test")
-    try:
-        logger.setLevel(logging.DEBUG)
-        yield logger
-    finally:
-        del logger.manager.loggerDict["test"]
+def logger(caplog) -> logging.Logger:
+    caplog.set_level(logging.DEBUG, logger="test")
+    return logging.getLogger("test")
+
+
+class TestCheckResult:
+    @staticmethod
+    def test_copy(conhead_config):
+        header_def = conhead_config.header_defs["header1"]
+        result = process_module.CheckResult(False, "", header_def, None, None)
+        assert not hasattr(result, "__dict__")
+
+        copied = copy.copy(result)
+        assert copied == result
+        assert copied.header_def is header_def
 
 
 @pytest.mark.usefixtures("fake_time")
@@ -82,7 +90,7 @@ class TestCheckPath:
         def fake_open(*args, **kwargs):
             raise TimeoutError("timeout error")
 
-        monkeypatch.setattr(pathlib.Path, "open", fake_open)
+        monkeypatch.setattr(process_module, "open", fake_open, raising=False)
 
         result = process_module.check_path(
             conhead_config,
@@ -267,7 +275,7 @@ class TestRewriteFile:
         def fake_open(*args, **kwargs):
             raise TimeoutError("timeout error")
 
-        monkeypatch.setattr(pathlib.Path, "open", fake_open)
+        monkeypatch.setattr(process_module, "open", fake_open, raising=False)
 
         assert not process_module.rewrite_file(
             "result.ext1",
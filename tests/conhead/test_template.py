@@ -1,6 +1,7 @@
 # Copyright 2022 Rafe Kaplan
 # SPDX-License-Identifier: Apache-2.0
 #
+import copy
 import datetime
 import re
 
@@ -47,6 +48,10 @@ class TestToken:
     def test_repr(token):
         assert repr(token) == "<token:FIELD '{{YEARS}}' 10:20 FieldKind.YEARS>"
 
+    @staticmethod
+    def test_slots(token):
+        assert not hasattr(token, "__dict__")
+
     class TestEq:
         @staticmethod
         def test_is(token):
@@ -101,6 +106,18 @@ class TestToken:
             assert token != other
 
 
+class TestParsedValues:
+    @staticmethod
+    def test_slots():
+        parsed = template.ParsedValues((fields.Years(2014, 2019),), "# 2014-2019\n")
+        assert not hasattr(parsed, "__dict__")
+
+    @staticmethod
+    def test_copy():
+        parsed = template.ParsedValues((fields.Years(2014, 2019),), "# 2014-2019\n")
+        assert copy.copy(parsed) == parsed
+
+
 class TestHeaderParser:
     class TestParseFields:
         @staticmethod
@@ -302,6 +319,11 @@ class TestMakeTemplateRe:
         assert match
         assert match.group(1) == unparsed
 
+    @staticmethod
+    def test_memoized():
+        parser = template.make_template_parser("line 1 {{YEARS}}.\n")
+        assert template.make_template_parser("line 1 {{YEARS}}.\n") is parser
+
     @staticmethod
     def test_escaping():
         parser = template.make_template_parser("line 1 \\{.\n line 2 \\}. line 3 \\\\.")
@@ -320,3 +342,12 @@ def test_write_header(template_field_kind, unparsed, parsed):
     )
 
     assert content == f"start {parsed} end\n"
+
+
+def test_write_header_escapes_and_multiple_fields():
+    content = template.write_header(
+        "\\{{{YEARS}}\\}\n{{YEARS}} end\n",
+        (fields.Years(2014, 2019), fields.Years(2019, 2019)),
+    )
+
+    assert content == "{2014-2019}\n2019 end\n"
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import copy
+import pickle
 
 import pytest
 
@@ -14,6 +15,18 @@ class TestFrozenDict:
         def test_empty():
             assert dict(util.FrozenDict()) == {}
 
+        @staticmethod
+        def test_empty_shared():
+            empty = util.FrozenDict()
+            assert util.FrozenDict() is empty
+            assert util.FrozenDict({}) is empty
+            assert copy.copy(empty) is empty
+            assert pickle.loads(pickle.dumps(empty)) is empty
+
+        @staticmethod
+        def test_slots():
+            assert not hasattr(util.FrozenDict(a=1), "__dict__")
+
         @staticmethod
         def test_kwargs():
             assert dict(util.FrozenDict(a=1, b=2)) == {"a": 1, "b": 2}
@@ -23,9 +36,15 @@ class TestFrozenDict:
             dct = {"a": 1, "b": 2}
             assert dict(util.FrozenDict(dct)) == dct
 
+        @staticmethod
+        def test_frozen_dict():
+            dct = util.FrozenDict(a=1, b=2)
+            assert util.FrozenDict(dct) == dct
+            assert util.FrozenDict(dct, b=3, c=4) == {"a": 1, "b": 2, "c": 4}
+
     class TestWithDct:
         @staticmethod
-        @pytest.fixture
+        @pytest.fixture(scope="class")
         def dct():
             return util.FrozenDict(a=1, b=2, c=util.FrozenDict())
 
@@ -71,6 +90,10 @@ class TestFrozenDict:
                 new_dct = dct | dict(c=5, d=6, e=7)
                 assert dict(new_dct) == {"a": 1, "b": 2, "c": 5, "d": 6, "e": 7}
 
+            @staticmethod
+            def test_empty(dct):
+                assert dct | {} is dct
+
             @staticmethod
             def test_incompatble(dct):
                 with pytest.raises(TypeError):
@@ -82,6 +105,10 @@ class TestFrozenDict:
                 new_dct = dict(c=5, d=6, e=7) | dct
                 assert dict(new_dct) == {"a": 1, "b": 2, "c": {}, "d": 6, "e": 7}
 
+            @staticmethod
+            def test_empty(dct):
+                assert {} | dct is dct
+
             @staticmethod
             def test_incompatble(dct):
                 with pytest.raises(TypeError):
@@ -107,4 +134,35 @@ class TestFrozenDict:
         def test_hash(dct):
             h = hash(dct)
             assert isinstance(h, int)
-            assert h == hash((("a", 1), ("b", 2), ("c", util.FrozenDict())))
+            assert h == hash(
+                frozenset({"a": 1, "b": 2, "c": util.FrozenDict()}.items())
+            )
+            assert hash(dct) == h
+
+        @staticmethod
+        def test_hash_order_independent(dct):
+            other = util.FrozenDict(c=util.FrozenDict(), b=2, a=1)
+            assert hash(other) == hash(dct)
+            assert other == dct
+
+        @staticmethod
+        def test_eq(dct):
+            other = util.FrozenDict(a=1, b=2, c=util.FrozenDict())
+            assert dct == other
+            assert dct == {"a": 1, "b": 2, "c": {}}
+            assert dct != util.FrozenDict(a=1, b=2)
+            assert dct != "a string"
+            assert dct == dct
+
+        @staticmethod
+        def test_eq_hashed(dct):
+            other = util.FrozenDict(a=1, b=2, c=util.FrozenDict(d=3))
+            hash(other)
+            hash(dct)
+            assert dct != other
+            assert other != dct
+            assert dct == util.FrozenDict(dct)
+
+        @staticmethod
+        def test_pickle(dct):
+            assert pickle.loads(pickle.dumps(dct)) == dct